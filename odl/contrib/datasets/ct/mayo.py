@@ -17,12 +17,34 @@ In addition to the standard ODL requirements, this library also requires:
 """
 
 from __future__ import division
+import mmap
 import numpy as np
 import os
+import re
+import struct
+import warnings
 import dicom
 import odl
 import tqdm
 
+from builtins import map
+from functools import partial
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without the `futures` backport
+    THREADS_AVAILABLE = False
+else:
+    THREADS_AVAILABLE = True
+
+try:
+    import numba
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
 from dicom.datadict import DicomDictionary, NameDict, CleanName
 from odl.discr.discr_utils import linear_interpolator
 from odl.contrib.datasets.ct.mayo_dicom_dict import new_dict_items
@@ -35,50 +57,250 @@ NameDict.update((CleanName(tag), tag) for tag in new_dict_items)
 __all__ = ('load_projections', 'load_reconstruction')
 
 
-def _read_projections(folder, indices):
-    """Read mayo projections from a folder."""
-    datasets = []
+# Value representations whose data element header has a 4 byte length field
+# (after 2 reserved bytes) in explicit VR encoding.
+LONG_LENGTH_VRS = (b'OB', b'OD', b'OF', b'OL', b'OW', b'SQ', b'UC', b'UN',
+                   b'UR', b'UT')
 
-    # Get the relevant file names
-    file_names = sorted([f for f in os.listdir(folder) if f.endswith(".dcm")])
+# Transfer syntaxes in which the pixel data is stored uncompressed as a
+# single data element, such that it can be mapped directly.
+UNCOMPRESSED_TRANSFER_SYNTAXES = (
+    '1.2.840.10008.1.2',  # Implicit VR Little Endian
+    '1.2.840.10008.1.2.1',  # Explicit VR Little Endian
+    '1.2.840.10008.1.2.2',  # Explicit VR Big Endian
+)
+
+
+def _map_pixel_data(dataset, file_map, offset):
+    """Return the pixel data element at ``offset`` as ``uint16`` view.
+
+    ``None`` is returned if the pixel data cannot be viewed directly,
+    i.e., if the transfer syntax is not one of
+    ``UNCOMPRESSED_TRANSFER_SYNTAXES`` or the element at ``offset`` is
+    not a pixel data element with a defined length that fits the file.
+    """
+    file_meta = getattr(dataset, 'file_meta', None)
+    transfer_syntax = getattr(file_meta, 'TransferSyntaxUID', None)
+    if transfer_syntax not in UNCOMPRESSED_TRANSFER_SYNTAXES:
+        return None
+
+    # The element header is at most 12 bytes long
+    if offset + 12 > len(file_map):
+        return None
+
+    endian = '<' if dataset.is_little_endian else '>'
+    group, elem = struct.unpack_from(endian + 'HH', file_map, offset)
+    if (group, elem) != (0x7fe0, 0x0010):
+        return None
+
+    if dataset.is_implicit_VR:
+        length, = struct.unpack_from(endian + 'I', file_map, offset + 4)
+        offset += 8
+    elif file_map[offset + 4:offset + 6] in LONG_LENGTH_VRS:
+        length, = struct.unpack_from(endian + 'I', file_map, offset + 8)
+        offset += 12
+    else:
+        length, = struct.unpack_from(endian + 'H', file_map, offset + 6)
+        offset += 8
+
+    # An undefined length (0xFFFFFFFF) means encapsulated pixel data
+    if length % 2 != 0 or offset + length > len(file_map):
+        return None
+
+    # The whole pixel data is used right away, so let the kernel read it
+    # ahead instead of faulting in one page at a time (Python >= 3.8)
+    if hasattr(mmap, 'MADV_WILLNEED'):
+        file_map.madvise(mmap.MADV_WILLNEED)
+
+    return np.frombuffer(file_map, dtype=endian + 'u2', count=length // 2,
+                         offset=offset)
+
+
+def _read_file_mapped(path):
+    """Read the header of a DICOM file and map its pixel data.
+
+    The pixel data is not copied to a ``bytes`` object; instead, the file
+    is memory-mapped and the pixels are returned as a read-only 1d
+    ``uint16`` view into the mapping. If the pixel data cannot be mapped,
+    e.g., since it is compressed, the whole file is read and the pixels
+    are taken from ``PixelData``.
+
+    Returns the dataset and the pixel array.
+    """
+    with open(path, 'rb') as fp:
+        # Reading stops at the start of the pixel data element
+        dataset = dicom.read_file(fp, stop_before_pixels=True)
+        offset = fp.tell()
+        # The mapping stays valid after the file is closed
+        file_map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    pixels = _map_pixel_data(dataset, file_map, offset)
+    if pixels is None:
+        dataset = dicom.read_file(path)
+        endian = '<' if dataset.is_little_endian else '>'
+        pixels = np.frombuffer(dataset.PixelData, dtype=endian + 'u2')
+
+    return dataset, pixels
+
+
+def _rescale_flip_numpy(proj_array, scale, bias, out):
+    """Write ``scale * proj_array + bias``, flipped along axis 1, to ``out``.
+    """
+    out_flipped = out[:, ::-1]
+    np.multiply(proj_array, scale, out=out_flipped, dtype='float32')
+    out_flipped += bias
+
+
+if NUMBA_AVAILABLE:
+    # The kernel releases the GIL, so it runs in parallel in the reader
+    # threads. We don't use `parallel=True` since Numba's default threading
+    # layer must not be entered from several threads at once.
+    @numba.njit(nogil=True, cache=True)
+    def _rescale_flip_numba(proj_array, scale, bias, out):
+        """Write ``scale * proj_array + bias``, flipped along axis 1, to
+        ``out``.
+        """
+        cols, rows = proj_array.shape
+        for c in range(cols):
+            for r in range(rows):
+                out[c, rows - 1 - r] = proj_array[c, r] * scale + bias
+
+    _rescale_flip = _rescale_flip_numba
+else:
+    _rescale_flip = _rescale_flip_numpy
+
+
+def _rescale_params(dataset):
+    """Return the header values that define the projection rescaling."""
+    return (dataset.RescaleSlope, dataset.RescaleIntercept,
+            dataset.HUCalibrationFactor)
+
+
+def _scale_bias(params):
+    """Return ``scale, bias`` such that ``scale * x + bias`` rescales ``x``.
+
+    This uses ``(slope * x + intercept) / hu_factor == scale * x + bias``
+    to save a pass over the data.
+    """
+    rescale_slope, rescale_intercept, hu_factor = params
+    return (np.float32(rescale_slope / hu_factor),
+            np.float32(rescale_intercept / hu_factor))
+
+
+def _read_one_projection(path, out, params, scale, bias):
+    """Read a single mayo projection file into ``out``.
+
+    ``out`` must be a float32 array of shape ``(cols, rows)``. The
+    projection is rescaled with ``scale`` and ``bias``, computed from
+    the rescale parameters ``params``, and flipped along the detector
+    rows. If the file has different rescale parameters, its own are used
+    and a warning is issued.
+
+    Returns the dataset.
+    """
+    dataset, pixels = _read_file_mapped(path)
+
+    # Get some required data
+    rows = dataset.NumberofDetectorRows
+    cols = dataset.NumberofDetectorColumns
+
+    file_params = _rescale_params(dataset)
+    if file_params != params:
+        warnings.warn('rescale parameters of {} differ from those of the '
+                      'first projection'.format(path), RuntimeWarning)
+        scale, bias = _scale_bias(file_params)
+
+    # The data is stored column by column, which is the same as a
+    # C-contiguous array of shape (cols, rows).
+    proj_array = pixels.reshape([cols, rows])
+
+    # Rescale array and write the result directly to the flipped output.
+    # No frame sized buffer is allocated per file: the input is a view of
+    # the file mapping and the output a part of the preallocated array.
+    _rescale_flip(proj_array, scale, bias, out)
+
+    return dataset
+
+
+def _progress(iterable, desc, total):
+    """Wrap ``iterable`` in a progress bar that is rarely refreshed.
+
+    With many small files, refreshing after each one costs noticeable
+    time in the main thread, so the bar is updated at most twice per
+    second and roughly 200 times in total.
+    """
+    return tqdm.tqdm(iterable, desc, total=total, mininterval=0.5,
+                     miniters=max(1, total // 200), smoothing=0)
+
+
+def _map_files(func, file_paths, arrays, desc):
+    """Return ``[func(p, a) for p, a in zip(file_paths, arrays)]``.
+
+    Parsing is dominated by file I/O, hence the files are read in
+    parallel threads if `concurrent.futures` is available. The results
+    are in the order of ``file_paths``.
+    """
+    if THREADS_AVAILABLE:
+        with ThreadPoolExecutor() as executor:
+            return list(_progress(executor.map(func, file_paths, arrays),
+                                  desc, total=len(file_paths)))
+    else:
+        return list(_progress(map(func, file_paths, arrays),
+                              desc, total=len(file_paths)))
+
+
+def _natural_sort_key(file_name):
+    """Key for sorting file names with numbers in numerical order.
+
+    Examples
+    --------
+    >>> sorted(['proj10.dcm', 'proj9.dcm', 'proj1.dcm'],
+    ...        key=_natural_sort_key)
+    ['proj1.dcm', 'proj9.dcm', 'proj10.dcm']
+    """
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r'(\d+)', file_name)]
+
+
+def _sorted_file_names(folder, extension):
+    """Return the names of files in ``folder`` ending with ``extension``.
+
+    The names are sorted such that numbers in them are in numerical
+    order.
+    """
+    file_names = [f for f in os.listdir(folder) if f.endswith(extension)]
 
     if len(file_names) == 0:
         raise ValueError('No DICOM files found in {}'.format(folder))
 
-    file_names = file_names[indices]
-
-    data_array = None
+    file_names.sort(key=_natural_sort_key)
+    return file_names
 
-    for i, file_name in enumerate(tqdm.tqdm(file_names,
-                                            'Loading projection data')):
-        # read the file
-        dataset = dicom.read_file(folder + '/' + file_name)
 
-        # Get some required data
-        rows = dataset.NumberofDetectorRows
-        cols = dataset.NumberofDetectorColumns
-        hu_factor = dataset.HUCalibrationFactor
-        rescale_intercept = dataset.RescaleIntercept
-        rescale_slope = dataset.RescaleSlope
+def _read_projections(folder, indices):
+    """Read mayo projections from a folder."""
+    # Get the relevant file names
+    file_names = _sorted_file_names(folder, '.dcm')
 
-        # Load the array as bytes
-        proj_array = np.array(np.frombuffer(dataset.PixelData, 'H'),
-                              dtype='float32')
-        proj_array = proj_array.reshape([rows, cols], order='F').T
+    file_names = file_names[indices]
+    file_paths = [os.path.join(folder, f) for f in file_names]
 
-        # Rescale array
-        proj_array *= rescale_slope
-        proj_array += rescale_intercept
-        proj_array /= hu_factor
+    # Read the header of the first file to get the shape, then load all
+    # projections directly into one array
+    dataset = dicom.read_file(file_paths[0], stop_before_pixels=True)
+    rows = dataset.NumberofDetectorRows
+    cols = dataset.NumberofDetectorColumns
+    data_array = np.empty((len(file_paths), cols, rows), dtype='float32')
 
-        # Store results
-        if data_array is None:
-            # We need to load the first dataset before we know the shape
-            data_array = np.empty((len(file_names), cols, rows),
-                                  dtype='float32')
+    # The rescaling is the same for all files of a series, so it is only
+    # computed once
+    params = _rescale_params(dataset)
+    scale, bias = _scale_bias(params)
+    read_one = partial(_read_one_projection,
+                       params=params, scale=scale, bias=bias)
 
-        data_array[i] = proj_array[:, ::-1]
-        datasets.append(dataset)
+    datasets = _map_files(read_one, file_paths, data_array,
+                          'Loading projection data')
 
     return datasets, data_array
 
@@ -104,10 +326,33 @@ def load_projections(folder, indices=None):
     """
     datasets, data_array = _read_projections(folder, indices)
 
-    # Get the angles
-    angles = [d.DetectorFocalCenterAngularPosition for d in datasets]
+    # Get the angles and the flying focal spot data in one pass. The angles
+    # need full precision, the small offsets are stored like the data.
+    num_proj = len(datasets)
+    angles = np.empty(num_proj)
+    offset_axial = np.empty(num_proj, dtype='float32')
+    offset_angular = np.empty(num_proj, dtype='float32')
+    offset_radial = np.empty(num_proj, dtype='float32')
+    for i, d in enumerate(datasets):
+        angles[i] = d.DetectorFocalCenterAngularPosition
+        offset_axial[i] = d.SourceAxialPositionShift
+        offset_angular[i] = d.SourceAngularPositionShift
+        offset_radial[i] = d.SourceRadialDistanceShift
+
     angles = -np.unwrap(angles) - np.pi  # different definition of angles
 
+    # The angle partition needs increasing angles, so if needed we sort the
+    # projections by angle. This is done once here, and only if required,
+    # since it copies the data.
+    if np.any(np.diff(angles) <= 0):
+        order = np.argsort(angles)
+        angles = angles[order]
+        offset_axial = offset_axial[order]
+        offset_angular = offset_angular[order]
+        offset_radial = offset_radial[order]
+        data_array = data_array.take(order, axis=0)
+        datasets = [datasets[i] for i in order]
+
     # Set minimum and maximum corners
     shape = np.array([datasets[0].NumberofDetectorColumns,
                       datasets[0].NumberofDetectorRows])
@@ -115,7 +360,8 @@ def load_projections(folder, indices=None):
                            datasets[0].DetectorElementAxialSpacing])
 
     # Correct from center of pixel to corner of pixel
-    minp = -(np.array(datasets[0].DetectorCentralElement) - 0.5) * pixel_size
+    minp = -(np.asarray(datasets[0].DetectorCentralElement, dtype=float) -
+             0.5) * pixel_size
     maxp = minp + shape * pixel_size
 
     # Select geometry parameters
@@ -130,11 +376,6 @@ def load_projections(folder, indices=None):
               datasets[0].DetectorFocalCenterAxialPosition) /
              ((np.max(angles) - np.min(angles)) / (2 * np.pi)))
 
-    # Get flying focal spot data
-    offset_axial = np.array([d.SourceAxialPositionShift for d in datasets])
-    offset_angular = np.array([d.SourceAngularPositionShift for d in datasets])
-    offset_radial = np.array([d.SourceRadialDistanceShift for d in datasets])
-
     # TODO(adler-j): Implement proper handling of flying focal spot.
     # Currently we do not fully account for it, merely making some "first
     # order corrections" to the detector position and radial offset.
@@ -176,12 +417,11 @@ def load_projections(folder, indices=None):
                                          pitch=pitch,
                                          offset_along_axis=offset_along_axis)
 
-    # Create a *temporary* ray transform (we need its range)
-    spc = odl.uniform_discr([-1] * 3, [1] * 3, [32] * 3)
-    ray_trafo = odl.tomo.RayTransform(spc, geometry, interp='linear')
-
-    # convert coordinates
-    theta, up, vp = ray_trafo.range.grid.meshgrid
+    # Convert coordinates. The grid of the geometry is the grid of the
+    # range of a ray transform with this geometry. Its meshgrid is sparse,
+    # hence ``u`` and ``v`` only have the size of the detector and are
+    # broadcast against the angles by the interpolator.
+    theta, up, vp = geometry.grid.meshgrid
     d = src_radius + det_radius
     u = d * np.arctan(up / d)
     v = d / np.sqrt(d**2 + up**2) * vp
@@ -189,11 +429,47 @@ def load_projections(folder, indices=None):
     # Calculate projection data in rectangular coordinates since we have no
     # backend that supports cylindrical
     interpolator = linear_interpolator(
-        data_array, ray_trafo.range.coord_vectors
+        data_array, geometry.grid.coord_vectors
     )
-    proj_data = interpolator((theta, u, v))
 
-    return geometry, proj_data.asarray()
+    # The interpolator creates several temporary arrays of the size of its
+    # output, hence we interpolate blocks of angles with about 2**20 points
+    # each, such that these temporaries stay small.
+    proj_data = np.empty(np.broadcast(theta, u, v).shape,
+                         dtype=data_array.dtype)
+    block_size = max(1, 2 ** 20 // proj_data[0].size)
+    for i in range(0, len(proj_data), block_size):
+        block = slice(i, i + block_size)
+        interpolator((theta[block], u, v), out=proj_data[block])
+
+    return geometry, proj_data
+
+
+def _read_one_slice(path, out):
+    """Read a single reconstructed slice into ``out``.
+
+    ``out`` must be a float32 array of shape ``(rows, cols)``, it is
+    filled with the slice converted to densities.
+
+    Returns the dataset.
+    """
+    dataset, pixels = _read_file_mapped(path)
+
+    rows = dataset.Rows
+    cols = dataset.Columns
+
+    # Get data array and convert to correct coordinates, the view
+    # ``data_array.T[:, ::-1]`` is the same as ``np.rot90(data_array, -1)``
+    data_array = pixels.reshape([cols, rows]).T[:, ::-1]
+
+    # Convert from storage type to densities, using
+    # ``(slope * x + intercept + 1000) / 1000 == scale * x + bias``
+    scale = np.float32(dataset.RescaleSlope / 1000)
+    bias = np.float32((dataset.RescaleIntercept + 1000) / 1000)
+    np.multiply(data_array, scale, out=out, dtype='float32')
+    out += bias
+
+    return dataset
 
 
 def load_reconstruction(folder, slice_start=0, slice_end=-1):
@@ -227,48 +503,38 @@ def load_reconstruction(folder, slice_start=0, slice_end=-1):
     This function should handle all of these peculiarities and give a volume
     with the correct coordinate system attached.
     """
-    file_names = sorted([f for f in os.listdir(folder) if f.endswith(".IMA")])
-
-    if len(file_names) == 0:
-        raise ValueError('No DICOM files found in {}'.format(folder))
-
-    volumes = []
-    datasets = []
-
+    file_names = _sorted_file_names(folder, '.IMA')
     file_names = file_names[slice_start:slice_end]
+    file_paths = [os.path.join(folder, f) for f in file_names]
 
-    for file_name in tqdm.tqdm(file_names, 'loading volume data'):
-        # read the file
-        dataset = dicom.read_file(folder + '/' + file_name)
-
-        # Get parameters
-        pixel_size = np.array(dataset.PixelSpacing)
-        pixel_thickness = float(dataset.SliceThickness)
-        rows = dataset.Rows
-        cols = dataset.Columns
+    # Read the header of the first file to get the shape, then load all
+    # slices directly into one array. The slices are stored along the first
+    # axis such that each thread writes a contiguous block.
+    dataset = dicom.read_file(file_paths[0], stop_before_pixels=True)
+    rows = dataset.Rows
+    cols = dataset.Columns
+    slices = np.empty((len(file_paths), rows, cols), dtype='float32')
 
-        # Get data array and convert to correct coordinates
-        data_array = np.array(np.frombuffer(dataset.PixelData, 'H'),
-                              dtype='float32')
-        data_array = data_array.reshape([cols, rows], order='C')
-        data_array = np.rot90(data_array, -1)
+    datasets = _map_files(_read_one_slice, file_paths, slices,
+                          'loading volume data')
 
-        # Convert from storage type to densities
-        # TODO: Optimize these computations
-        hu_values = (dataset.RescaleSlope * data_array +
-                     dataset.RescaleIntercept)
-        densities = (hu_values + 1000) / 1000
+    # Get parameters
+    dataset = datasets[-1]
+    pixel_thickness = float(dataset.SliceThickness)
 
-        # Store results
-        volumes.append(densities)
-        datasets.append(dataset)
+    voxel_size = np.empty(3)
+    voxel_size[:2] = dataset.PixelSpacing
+    voxel_size[2] = pixel_thickness
+    shape = np.array([rows, cols, len(datasets)])
 
-    voxel_size = np.array(list(pixel_size) + [pixel_thickness])
-    shape = np.array([rows, cols, len(volumes)])
+    # Collect the centers of all slices in an array of shape (N, 3)
+    centers = np.fromiter(
+        (c for d in datasets for c in d.DataCollectionCenterPatient),
+        dtype=float, count=3 * len(datasets)).reshape([-1, 3])
 
     # Compute geometry parameters
-    mid_pt = (np.array(dataset.ReconstructionTargetCenterPatient) -
-              np.array(dataset.DataCollectionCenterPatient))
+    mid_pt = (np.asarray(dataset.ReconstructionTargetCenterPatient,
+                         dtype=float) - centers[-1])
     reconstruction_size = (voxel_size * shape)
     min_pt = mid_pt - reconstruction_size / 2
     max_pt = mid_pt + reconstruction_size / 2
@@ -277,9 +543,7 @@ def load_reconstruction(folder, slice_start=0, slice_end=-1):
     min_pt[1], max_pt[1] = -max_pt[1], -min_pt[1]
 
     if len(datasets) > 1:
-        slice_distance = np.abs(
-            float(datasets[1].DataCollectionCenterPatient[2]) -
-            float(datasets[0].DataCollectionCenterPatient[2]))
+        slice_distance = np.abs(centers[1, 2] - centers[0, 2])
     else:
         # If we only have one slice, we must approximate the distance.
         slice_distance = pixel_thickness
@@ -288,14 +552,13 @@ def load_reconstruction(folder, slice_start=0, slice_end=-1):
     # DICOM attribute "DataCollectionCenterPatient". Since ODL uses corner
     # points (e.g. edge of volume) we need to add half a voxel thickness to
     # both sides.
-    min_pt[2] = -np.array(datasets[0].DataCollectionCenterPatient)[2]
-    min_pt[2] -= 0.5 * slice_distance
-    max_pt[2] = -np.array(datasets[-1].DataCollectionCenterPatient)[2]
-    max_pt[2] += 0.5 * slice_distance
+    min_pt[2] = -centers[0, 2] - 0.5 * slice_distance
+    max_pt[2] = -centers[-1, 2] + 0.5 * slice_distance
 
     partition = odl.uniform_partition(min_pt, max_pt, shape)
 
-    volume = np.transpose(np.array(volumes), (1, 2, 0))
+    # Put the slice axis last, as a view
+    volume = np.transpose(slices, (1, 2, 0))
 
     return partition, volume
 
@@ -0,0 +1,90 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the Mayo dataset loaders."""
+
+from __future__ import division
+import os
+
+import numpy as np
+import pytest
+
+import odl
+from odl.util.testutils import all_equal, simple_fixture
+
+dicom = pytest.importorskip('dicom')
+pytest.importorskip('tqdm')
+
+from dicom.dataset import Dataset, FileDataset  # noqa: E402
+from odl.contrib.datasets.ct import mayo  # noqa: E402
+
+
+transfer_syntax = simple_fixture(
+    'transfer_syntax',
+    ['1.2.840.10008.1.2', '1.2.840.10008.1.2.1', '1.2.840.10008.1.2.2'])
+
+
+def _write_dicom(path, pixels, transfer_syntax):
+    """Write ``pixels`` as a minimal DICOM image file to ``path``."""
+    file_meta = Dataset()
+    file_meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+    file_meta.MediaStorageSOPInstanceUID = '1.2.3.4'
+    file_meta.ImplementationClassUID = '1.2.3.4.5'
+    file_meta.TransferSyntaxUID = transfer_syntax
+
+    is_implicit_VR = transfer_syntax == '1.2.840.10008.1.2'
+    is_little_endian = transfer_syntax != '1.2.840.10008.1.2.2'
+    dataset = FileDataset(path, {}, file_meta=file_meta,
+                          preamble=b'\0' * 128,
+                          is_implicit_VR=is_implicit_VR,
+                          is_little_endian=is_little_endian)
+    dataset.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    dataset.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    dataset.Rows, dataset.Columns = pixels.shape
+    dataset.SamplesPerPixel = 1
+    dataset.PhotometricInterpretation = 'MONOCHROME2'
+    dataset.BitsAllocated = 16
+    dataset.BitsStored = 16
+    dataset.HighBit = 15
+    dataset.PixelRepresentation = 0
+    dtype = '<u2' if is_little_endian else '>u2'
+    dataset.PixelData = pixels.astype(dtype).tobytes()
+    dataset[0x7fe0, 0x0010].VR = 'OW'
+    dataset.save_as(path)
+
+
+def test_read_file_mapped(tmpdir, transfer_syntax):
+    """Check the mapped pixel data against pydicom's ``pixel_array``."""
+    path = os.path.join(str(tmpdir), 'image.dcm')
+    pixels = np.arange(12, dtype='uint16').reshape((3, 4)) * 1000
+    _write_dicom(path, pixels, transfer_syntax)
+
+    dataset, mapped = mayo._read_file_mapped(path)
+    expected = dicom.read_file(path).pixel_array
+    assert dataset.Rows == 3
+    assert dataset.Columns == 4
+    assert all_equal(mapped.reshape(expected.shape), expected)
+    assert all_equal(mapped.reshape(pixels.shape), pixels)
+
+
+def test_read_file_mapped_fallback(tmpdir, monkeypatch):
+    """Check reading of pixel data that is not mapped."""
+    path = os.path.join(str(tmpdir), 'image.dcm')
+    pixels = np.arange(12, dtype='uint16').reshape((3, 4)) * 1000
+    _write_dicom(path, pixels, '1.2.840.10008.1.2.1')
+
+    # Make the transfer syntax unexpected to enforce the fallback
+    monkeypatch.setattr(mayo, 'UNCOMPRESSED_TRANSFER_SYNTAXES', ())
+    dataset, read = mayo._read_file_mapped(path)
+    expected = dicom.read_file(path).pixel_array
+    assert dataset.Rows == 3
+    assert all_equal(read.reshape(expected.shape), expected)
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -95,8 +95,8 @@ class OperatorTest(object):
 
     def self_adjoint(self):
         """Verify ``<Ax, y> == <x, Ay>``."""
-        left_inner_vals = []
-        right_inner_vals = []
+        # Sums for the least squares fit of `r_inner = scale * l_inner`
+        sum_ll = sum_lr = 0.0
 
         with fail_counter(
             test_name='Verifying the identity <Ax, y> = <x, Ay>',
@@ -104,32 +104,37 @@ class OperatorTest(object):
             logger=self.log
         ) as counter:
 
-            for [name_x, x], [name_y, y] in samples(self.operator.domain,
-                                                    self.operator.range):
-                x_norm = x.norm()
-                y_norm = y.norm()
+            # Norms and operator images are needed for all pairs, compute
+            # them once per example
+            dom_samples = [(name, x, x.norm(), self.operator(x))
+                           for name, x in samples(self.operator.domain)]
+            ran_samples = [(name, y, y.norm(), self.operator(y))
+                           for name, y in samples(self.operator.range)]
 
-                l_inner = self.operator(x).inner(y)
-                r_inner = x.inner(self.operator(y))
+            for name_x, x, x_norm, opx in dom_samples:
+                for name_y, y, y_norm, opy in ran_samples:
+                    l_inner = opx.inner(y)
+                    r_inner = x.inner(opy)
 
-                denom = self.operator_norm * x_norm * y_norm
-                error = 0 if denom == 0 else abs(l_inner - r_inner) / denom
+                    denom = self.operator_norm * x_norm * y_norm
+                    error = (0 if denom == 0
+                             else abs(l_inner - r_inner) / denom)
 
-                if error > self.tol:
-                    counter.fail('x={:25s} y={:25s} : error={:6.5f}'
-                                 ''.format(name_x, name_y, error))
+                    if error > self.tol:
+                        counter.fail('x={:25s} y={:25s} : error={:6.5f}'
+                                     ''.format(name_x, name_y, error))
 
-                left_inner_vals.append(l_inner)
-                right_inner_vals.append(r_inner)
+                    sum_ll += abs(l_inner) ** 2
+                    sum_lr += np.conj(l_inner) * r_inner
 
-        scale = np.polyfit(left_inner_vals, right_inner_vals, 1)[0]
+        scale = sum_lr / sum_ll if sum_ll != 0 else float('nan')
         self.log('\nThe adjoint seems to be scaled according to:')
         self.log('(x, Ay) / (Ax, y) = {}. Should be 1.0'.format(scale))
 
     def _adjoint_definition(self):
         """Verify ``<Ax, y> == <x, A^* y>``."""
-        left_inner_vals = []
-        right_inner_vals = []
+        # Sums for the least squares fit of `r_inner = scale * l_inner`
+        sum_ll = sum_lr = 0.0
 
         with fail_counter(
             test_name='Verifying the identity <Ax, y> = <x, A^T y>',
@@ -137,37 +142,41 @@ class OperatorTest(object):
             logger=self.log
         ) as counter:
 
-            for [name_x, x], [name_y, y] in samples(self.operator.domain,
-                                                    self.operator.range):
-                x_norm = x.norm()
-                y_norm = y.norm()
+            dom_samples = [(name, x, x.norm(), self.operator(x))
+                           for name, x in samples(self.operator.domain)]
+            ran_samples = [(name, y, y.norm(), self.operator.adjoint(y))
+                           for name, y in samples(self.operator.range)]
 
-                l_inner = self.operator(x).inner(y)
-                r_inner = x.inner(self.operator.adjoint(y))
+            for name_x, x, x_norm, opx in dom_samples:
+                for name_y, y, y_norm, op_adj_y in ran_samples:
+                    l_inner = opx.inner(y)
+                    r_inner = x.inner(op_adj_y)
 
-                denom = self.operator_norm * x_norm * y_norm
-                error = 0 if denom == 0 else abs(l_inner - r_inner) / denom
+                    denom = self.operator_norm * x_norm * y_norm
+                    error = (0 if denom == 0
+                             else abs(l_inner - r_inner) / denom)
 
-                if error > self.tol:
-                    counter.fail('x={:25s} y={:25s} : error={:6.5f}'
-                                 ''.format(name_x, name_y, error))
+                    if error > self.tol:
+                        counter.fail('x={:25s} y={:25s} : error={:6.5f}'
+                                     ''.format(name_x, name_y, error))
 
-                left_inner_vals.append(l_inner)
-                right_inner_vals.append(r_inner)
+                    sum_ll += abs(l_inner) ** 2
+                    sum_lr += np.conj(l_inner) * r_inner
 
-        scale = np.polyfit(left_inner_vals, right_inner_vals, 1)[0]
+        scale = sum_lr / sum_ll if sum_ll != 0 else float('nan')
         self.log('\nThe adjoint seems to be scaled according to:')
         self.log('(x, A^T y) / (Ax, y) = {}. Should be 1.0'.format(scale))
 
     def _adjoint_of_adjoint(self):
         """Verify ``(A^*)^* == A``"""
         try:
-            self.operator.adjoint.adjoint
+            # The adjoint is often created on access, get it only once
+            op_adj_adj = self.operator.adjoint.adjoint
         except AttributeError:
             print('A^* has no adjoint')
             return
 
-        if self.operator.adjoint.adjoint is self.operator:
+        if op_adj_adj is self.operator:
             self.log('(A^*)^* == A')
             return
 
@@ -178,7 +187,7 @@ class OperatorTest(object):
         ) as counter:
             for [name_x, x] in self.operator.domain.examples:
                 opx = self.operator(x)
-                op_adj_adj_x = self.operator.adjoint.adjoint(x)
+                op_adj_adj_x = op_adj_adj(x)
 
                 denom = self.operator_norm * x.norm()
                 if denom == 0:
@@ -239,36 +248,41 @@ class OperatorTest(object):
             err_msg="error = inf_c ||A(x+c*p)-A(x)-A'(x)(c*p)|| / c",
             logger=self.log
         ) as counter:
-            for [name_x, x], [name_dx, dx] in samples(self.operator.domain,
-                                                      self.operator.domain):
-                # Precompute some values
+            x_samples = list(samples(self.operator.domain))
+            dx_samples = list(samples(self.operator.domain))
+
+            for name_x, x in x_samples:
+                # Precompute the values that only depend on `x`
                 deriv = self.operator.derivative(x)
-                derivdx = deriv(dx)
                 opx = self.operator(x)
 
-                c = 1e-4  # initial step
-                derivative_ok = False
+                for name_dx, dx in dx_samples:
+                    derivdx = deriv(dx)
+
+                    c = 1e-4  # initial step
+                    derivative_ok = False
 
-                minerror = float('inf')
-                while c > 1e-14:
-                    exact_step = self.operator(x + dx * c) - opx
-                    expected_step = c * derivdx
-                    err = (exact_step - expected_step).norm() / c
+                    minerror = float('inf')
+                    while c > 1e-14:
+                        exact_step = self.operator(x + dx * c) - opx
+                        expected_step = c * derivdx
+                        err = (exact_step - expected_step).norm() / c
 
-                    # Need to be slightly more generous here due to possible
-                    # numerical instabilities.
-                    # TODO: perform more tests to find a good threshold here.
-                    if err < 10 * self.tol:
-                        derivative_ok = True
-                        break
-                    else:
-                        minerror = min(minerror, err)
+                        # Need to be slightly more generous here due to
+                        # possible numerical instabilities.
+                        # TODO: perform more tests to find a good threshold
+                        # here.
+                        if err < 10 * self.tol:
+                            derivative_ok = True
+                            break
+                        else:
+                            minerror = min(minerror, err)
 
-                    c /= 10.0
+                        c /= 10.0
 
-                if not derivative_ok:
-                    counter.fail('x={:15s} p={:15s}, error={}'
-                                 ''.format(name_x, name_dx, minerror))
+                    if not derivative_ok:
+                        counter.fail('x={:15s} p={:15s}, error={}'
+                                     ''.format(name_x, name_dx, minerror))
 
     def derivative(self):
         """Verify that `Operator.derivative` works appropriately.
@@ -311,18 +325,23 @@ class OperatorTest(object):
             err_msg='error = ||A(c*x)-c*A(x)|| / |c| ||A|| ||x||',
             logger=self.log
         ) as counter:
-            for [name_x, x], [_, scale] in samples(self.operator.domain,
-                                                   self.operator.domain.field):
+            scales = [scale for _, scale
+                      in samples(self.operator.domain.field)]
+
+            for name_x, x in samples(self.operator.domain):
                 opx = self.operator(x)
-                scaled_opx = self.operator(scale * x)
+                x_norm = x.norm()
 
-                denom = self.operator_norm * scale * x.norm()
-                error = (0 if denom == 0
-                         else (scaled_opx - opx * scale).norm() / denom)
+                for scale in scales:
+                    scaled_opx = self.operator(scale * x)
 
-                if error > self.tol:
-                    counter.fail('x={:25s} scale={:7.2f} error={:6.5f}'
-                                 ''.format(name_x, scale, error))
+                    denom = self.operator_norm * scale * x_norm
+                    error = (0 if denom == 0
+                             else (scaled_opx - opx * scale).norm() / denom)
+
+                    if error > self.tol:
+                        counter.fail('x={:25s} scale={:7.2f} error={:6.5f}'
+                                     ''.format(name_x, scale, error))
 
     def _addition_invariance(self):
         """Verify ``A(x+y) = A(x) + A(y)``."""
@@ -332,19 +351,20 @@ class OperatorTest(object):
                     '||A||(||x|| + ||y||)',
             logger=self.log
         ) as counter:
-            for [name_x, x], [name_y, y] in samples(self.operator.domain,
-                                                    self.operator.domain):
-                opx = self.operator(x)
-                opy = self.operator(y)
-                opxy = self.operator(x + y)
+            dom_samples = [(name, x, x.norm(), self.operator(x))
+                           for name, x in samples(self.operator.domain)]
 
-                denom = self.operator_norm * (x.norm() + y.norm())
-                error = (0 if denom == 0
-                         else (opxy - opx - opy).norm() / denom)
+            for name_x, x, x_norm, opx in dom_samples:
+                for name_y, y, y_norm, opy in dom_samples:
+                    opxy = self.operator(x + y)
 
-                if error > self.tol:
-                    counter.fail('x={:25s} y={:25s} error={:6.5f}'
-                                 ''.format(name_x, name_y, error))
+                    denom = self.operator_norm * (x_norm + y_norm)
+                    error = (0 if denom == 0
+                             else (opxy - opx - opy).norm() / denom)
+
+                    if error > self.tol:
+                        counter.fail('x={:25s} y={:25s} error={:6.5f}'
+                                     ''.format(name_x, name_y, error))
 
     def linear(self):
         """Verify that the operator is actually linear."""
@@ -760,6 +760,46 @@ class DiscretizedSpaceElement(Tensor):
         self.tensor.__ipow__(p)
         return self
 
+    def __iadd__(self, other):
+        """Implement ``self += other``."""
+        # Let the concrete `tensor` handle scalars, it can add them
+        # without creating `space.one()`. Same for the methods below.
+        if self.space.field is not None and other in self.space.field:
+            self.tensor.__iadd__(other)
+            return self
+        return super(DiscretizedSpaceElement, self).__iadd__(other)
+
+    def __add__(self, other):
+        """Return ``self + other``."""
+        if self.space.field is not None and other in self.space.field:
+            return self.space.element(self.tensor + other)
+        return super(DiscretizedSpaceElement, self).__add__(other)
+
+    def __isub__(self, other):
+        """Implement ``self -= other``."""
+        if self.space.field is not None and other in self.space.field:
+            self.tensor.__isub__(other)
+            return self
+        return super(DiscretizedSpaceElement, self).__isub__(other)
+
+    def __sub__(self, other):
+        """Return ``self - other``."""
+        if self.space.field is not None and other in self.space.field:
+            return self.space.element(self.tensor - other)
+        return super(DiscretizedSpaceElement, self).__sub__(other)
+
+    def __rsub__(self, other):
+        """Return ``other - self``."""
+        if self.space.field is not None and other in self.space.field:
+            return self.space.element(other - self.tensor)
+        return super(DiscretizedSpaceElement, self).__rsub__(other)
+
+    def __neg__(self):
+        """Return ``-self``."""
+        if self.space.field is None:
+            return NotImplemented
+        return self.space.element(-self.tensor)
+
     @property
     def real(self):
         """Real part of this element.
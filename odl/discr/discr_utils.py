@@ -565,11 +565,11 @@ class _Interpolator(object):
             Interpolated values. If ``out`` was given, the returned
             object is a reference to it.
         """
-        x = np.asarray(x)
         ndim = len(self.coord_vecs)
         scalar_out = False
 
         if self.input_type == 'array':
+            x = np.asarray(x)
             if ndim == 1:
                 scalar_out = x.ndim == 0
             else:
@@ -864,12 +864,24 @@ def _check_func_out_arg(func):
         If ``func``'s signature has ``*args``.
     """
     if sys.version_info.major > 2:
-        spec = inspect.getfullargspec(func)
-        kw_only = spec.kwonlyargs
-    else:
-        spec = inspect.getargspec(func)
-        kw_only = ()
+        # Use the signature directly, `getfullargspec` builds it anyway
+        params = inspect.signature(func, follow_wrapped=False).parameters
+        if any(p.kind == p.VAR_POSITIONAL for p in params.values()):
+            raise TypeError('*args not allowed in function signature')
+
+        out = params.get('out', None)
+        if out is None:
+            has_out = out_optional = False
+        elif out.kind == out.KEYWORD_ONLY:
+            has_out = out_optional = True
+        else:
+            has_out = True
+            out_optional = (out.default is not out.empty)
+
+        return has_out, out_optional
 
+    # Python 2 has no keyword-only arguments
+    spec = inspect.getargspec(func)
     if spec.varargs is not None:
         raise TypeError('*args not allowed in function signature')
 
@@ -881,8 +893,6 @@ def _check_func_out_arg(func):
         out_optional = (
             pos_args.index('out') >= len(pos_args) - len(pos_defaults)
         )
-    elif 'out' in kw_only:
-        has_out = out_optional = True
     else:
         has_out = out_optional = False
 
@@ -967,10 +977,10 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
 
     def _default_oop(func_ip, x, **kwargs):
         """Default out-of-place variant of an in-place-only function."""
-        if is_valid_input_array(x, domain.ndim):
-            scalar_out_shape = out_shape_from_array(x)
-        elif is_valid_input_meshgrid(x, domain.ndim):
+        if is_valid_input_meshgrid(x, domain.ndim):
             scalar_out_shape = out_shape_from_meshgrid(x)
+        elif is_valid_input_array(x, domain.ndim):
+            scalar_out_shape = out_shape_from_array(x)
         else:
             raise TypeError('invalid input `x`')
 
@@ -985,10 +995,10 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
         if result.dtype == object:
             # Different shapes encountered, need to broadcast
             flat_results = result.ravel()
-            if is_valid_input_array(x, domain.ndim):
-                scalar_out_shape = out_shape_from_array(x)
-            elif is_valid_input_meshgrid(x, domain.ndim):
+            if is_valid_input_meshgrid(x, domain.ndim):
                 scalar_out_shape = out_shape_from_meshgrid(x)
+            elif is_valid_input_array(x, domain.ndim):
+                scalar_out_shape = out_shape_from_array(x)
             else:
                 raise TypeError('invalid input `x`')
 
@@ -1060,6 +1070,11 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
 
         arr = arr.ravel().tolist()
 
+        # Inspecting the signature of a function is slow, hence we determine
+        # once here which members take an `out` argument
+        has_out_list = [_func_out_type(f)[0] if callable(f) else False
+                        for f in arr]
+
         def array_wrapper_func(x, out=None, **kwargs):
             """Function wrapping an array of callables and constants.
 
@@ -1097,7 +1112,7 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
                 # `results.append(f(x))`, just for a bunch of cases
                 # and with or without `out`.
                 results = []
-                for f in arr:
+                for f, has_out in zip(arr, has_out_list):
                     if np.isscalar(f):
                         # Constant function
                         results.append(f)
@@ -1109,16 +1124,14 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
                     elif hasattr(f, 'nin') and hasattr(f, 'nout'):
                         # ufunc-like object
                         results.append(f(x, **kwargs))
+                    elif has_out:
+                        out = np.empty(
+                            scalar_out_shape, dtype=scalar_out_dtype
+                        )
+                        f(x, out=out, **kwargs)
+                        results.append(out)
                     else:
-                        has_out, _ = _func_out_type(f)
-                        if has_out:
-                            out = np.empty(
-                                scalar_out_shape, dtype=scalar_out_dtype
-                            )
-                            f(x, out=out, **kwargs)
-                            results.append(out)
-                        else:
-                            results.append(f(x, **kwargs))
+                        results.append(f(x, **kwargs))
 
                 # Broadcast to required shape and convert to array.
                 # This will raise an error if the shape of some member
@@ -1148,15 +1161,14 @@ def sampling_function(func_or_arr, domain, out_dtype=None):
                     # Flatten tensor axes to work on one tensor
                     # component (= scalar function) at a time
                     out_comps = out_arr.reshape((-1,) + scalar_out_shape)
-                    for f, out_comp in zip(arr, out_comps):
+                    for f, has_out, out_comp in zip(arr, has_out_list,
+                                                    out_comps):
                         if np.isscalar(f):
                             out_comp[:] = f
+                        elif has_out:
+                            f(x, out=out_comp, **kwargs)
                         else:
-                            has_out, _ = _func_out_type(f)
-                            if has_out:
-                                f(x, out=out_comp, **kwargs)
-                            else:
-                                out_comp[:] = f(x, **kwargs)
+                            out_comp[:] = f(x, **kwargs)
 
         func_ip = func_oop = array_wrapper_func
 
@@ -1242,8 +1254,14 @@ def _make_dual_use_func(func_ip, func_oop, domain, out_dtype):
                 ''.format(domain)
             )
 
-        # Check for input type and determine output shape
-        if is_valid_input_meshgrid(x, ndim):
+        # Check for input type and determine output shape. A correctly
+        # shaped point array is the most common input and checked first.
+        if (isinstance(x, np.ndarray) and x.ndim == 2 and
+                x.shape[0] == ndim):
+            scalar_in = False
+            scalar_out_shape = (x.shape[1],)
+            scalar_out = False
+        elif is_valid_input_meshgrid(x, ndim):
             scalar_in = False
             scalar_out_shape = out_shape_from_meshgrid(x)
             scalar_out = False
@@ -1256,7 +1274,7 @@ def _make_dual_use_func(func_ip, func_oop, domain, out_dtype):
             scalar_out_shape = out_shape_from_array(x)
             scalar_out = False
         elif x in domain:
-            x = np.atleast_2d(x).T  # make a (d, 1) array
+            x = np.asarray(x).reshape(-1, 1)  # make a (d, 1) array
             scalar_in = True
             scalar_out_shape = (1,)
             scalar_out = (out is None and not tensor_valued)
@@ -1271,8 +1289,9 @@ def _make_dual_use_func(func_ip, func_oop, domain, out_dtype):
                 ''.format(x, txt_1d, domain=domain)
             )
 
-        # Check bounds if specified
-        if bounds_check and not domain.contains_all(x):
+        # Check bounds if specified. A single point has already been found
+        # to lie in the domain above.
+        if bounds_check and not scalar_in and not domain.contains_all(x):
             raise ValueError('input contains points outside the domain {!r}'
                              ''.format(domain))
 
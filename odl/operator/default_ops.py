@@ -20,6 +20,7 @@ from odl.operator.operator import Operator
 from odl.set import ComplexNumbers, Field, LinearSpace, RealNumbers
 from odl.set.space import LinearSpaceElement
 from odl.space import ProductSpace
+from odl.space.base_tensors import TensorSpace
 
 __all__ = ('ScalingOperator', 'ZeroOperator', 'IdentityOperator',
            'LinCombOperator', 'MultiplyOperator', 'PowerOperator',
@@ -439,6 +440,11 @@ class PowerOperator(Operator):
             domain, domain, linear=(exponent == 1))
         self.__exponent = float(exponent)
         self.__domain_is_field = isinstance(domain, Field)
+        # The `np.power` fast path in `_call` is only safe for floating
+        # point data since `exponent` is a float
+        self.__domain_is_float_tensor_space = (
+            isinstance(domain, TensorSpace)
+            and (domain.is_real or domain.is_complex))
 
     @property
     def exponent(self):
@@ -451,6 +457,9 @@ class PowerOperator(Operator):
             return x ** self.exponent
         elif self.__domain_is_field:
             raise ValueError('cannot use `out` with field')
+        elif self.__domain_is_float_tensor_space:
+            # Single pass instead of copying to `out` first
+            np.power(x, self.exponent, out=out)
         else:
             out.assign(x)
             out **= self.exponent
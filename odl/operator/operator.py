@@ -1460,7 +1460,7 @@ class OperatorPointwiseProduct(Operator):
         ``OperatorPointwiseProduct(left, right)(x) == left(x) * right(x)``
     """
 
-    def __init__(self, left, right):
+    def __init__(self, left, right, tmp_ran=None):
         """Initialize a new instance.
 
         Parameters
@@ -1470,6 +1470,9 @@ class OperatorPointwiseProduct(Operator):
         right : `Operator`
             The second factor. Must have the same domain and range as
             ``left``.
+        tmp_ran : `Operator.range` element, optional
+            Used to avoid the creation of a temporary when applying the
+            operator.
         """
         if left.range != right.range:
             raise OpTypeError('operator ranges {!r} and {!r} do not match'
@@ -1480,11 +1483,15 @@ class OperatorPointwiseProduct(Operator):
         if left.domain != right.domain:
             raise OpTypeError('operator domains {!r} and {!r} do not match'
                               ''.format(left.domain, right.domain))
+        if tmp_ran is not None and tmp_ran not in left.range:
+            raise OpRangeError('`tmp_ran` {!r} not an element of the operator '
+                               'range {!r}'.format(tmp_ran, left.range))
 
         super(OperatorPointwiseProduct, self).__init__(
             left.domain, left.range, linear=False)
         self.__left = left
         self.__right = right
+        self.__tmp_ran = tmp_ran
 
     @property
     def left(self):
@@ -1501,7 +1508,8 @@ class OperatorPointwiseProduct(Operator):
         if out is None:
             return self.left(x) * self.right(x)
         else:
-            tmp = self.right.range.element()
+            tmp = (self.__tmp_ran if self.__tmp_ran is not None
+                   else self.range.element())
             # Write to `tmp` first, otherwise aliased `x` and `out` lead
             # to wrong result
             self.left(x, out=tmp)
@@ -1763,6 +1771,12 @@ class OperatorRightScalarMult(Operator):
         """Implement ``self(x[, out])``."""
         if out is None:
             return self.operator(self.scalar * x)
+        elif (self.is_linear and self.range.field is not None and
+              self.scalar in self.range.field):
+            # Linear case: op(s * x) == s * op(x), so the result can be
+            # scaled in place without a temporary in the domain
+            self.operator(x, out=out)
+            out *= self.scalar
         else:
             if self.__tmp is not None:
                 tmp = self.__tmp
@@ -2110,7 +2124,7 @@ class OperatorRightVectorMult(Operator):
     ``op.domain``.
     """
 
-    def __init__(self, operator, vector):
+    def __init__(self, operator, vector, tmp=None):
         """Initialize a new `OperatorRightVectorMult` instance.
 
         Parameters
@@ -2119,6 +2133,9 @@ class OperatorRightVectorMult(Operator):
             The domain of ``operator`` must be a ``vector.space``.
         vector : ``op.domain`` element
             The fixed element to multiply with.
+        tmp : `domain` element, optional
+            Used to avoid the creation of a temporary when applying the
+            operator.
         """
         if not isinstance(operator, Operator):
             raise TypeError('`operator` {!r} not an `Operator` instance'
@@ -2128,10 +2145,16 @@ class OperatorRightVectorMult(Operator):
             raise OpDomainError('`vector` {!r} not in operator.domain {!r}'
                                 ''.format(vector.space, operator.domain))
 
+        if tmp is not None and tmp not in operator.domain:
+            raise OpDomainError('`tmp` {!r} not an element of the '
+                                'operator domain {!r}'
+                                ''.format(tmp, operator.domain))
+
         super(OperatorRightVectorMult, self).__init__(
             operator.domain, operator.range, linear=operator.is_linear)
         self.__operator = operator
         self.__vector = vector
+        self.__tmp = tmp
 
     @property
     def operator(self):
@@ -2148,7 +2171,8 @@ class OperatorRightVectorMult(Operator):
         if out is None:
             return self.operator(x * self.vector)
         else:
-            tmp = self.domain.element()
+            tmp = (self.__tmp if self.__tmp is not None
+                   else self.domain.element())
             x.multiply(self.vector, out=tmp)
             self.operator(tmp, out=out)
 
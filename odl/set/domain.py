@@ -379,9 +379,8 @@ class IntervalProd(Set):
         """
         atol = float(atol)
 
-        # First try optimized methods
-        if other in self:
-            return True
+        # First try optimized methods. The test for a single point comes
+        # last since it converts the input to a float array.
         if hasattr(other, 'meshgrid'):
             return self.contains_all(other.meshgrid, atol=atol)
         elif is_valid_input_meshgrid(other, self.ndim):
@@ -391,18 +390,18 @@ class IntervalProd(Set):
             return (np.all(mins >= self.min_pt - atol) and
                     np.all(maxs <= self.max_pt + atol))
 
-        # Convert to array and check each element
-        other = np.asarray(other)
-        if is_valid_input_array(other, self.ndim):
+        # Convert to array and check the extreme values per axis
+        other_arr = np.asarray(other)
+        if is_valid_input_array(other_arr, self.ndim):
             if self.ndim == 1:
-                mins = np.min(other)
-                maxs = np.max(other)
+                mins = np.min(other_arr)
+                maxs = np.max(other_arr)
             else:
-                mins = np.min(other, axis=1)
-                maxs = np.max(other, axis=1)
+                mins = np.min(other_arr, axis=1)
+                maxs = np.max(other_arr, axis=1)
             return np.all(mins >= self.min_pt) and np.all(maxs <= self.max_pt)
         else:
-            return False
+            return other in self
 
     def measure(self, ndim=None):
         """Return the Lebesgue measure of this interval product.
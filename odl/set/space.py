@@ -623,8 +623,7 @@ class LinearSpaceElement(object):
             else:
                 # other --> other * space.one()
                 tmp = one()
-                self.space.lincomb(other, tmp, out=tmp)
-                return self.space.lincomb(1, tmp, -1, self, out=tmp)
+                return self.space.lincomb(other, tmp, -1, self, out=tmp)
         else:
             try:
                 other = self.space.element(other)
@@ -783,15 +782,20 @@ class LinearSpaceElement(object):
             return self
         elif p == 1:
             return self
-        elif p % 2 == 0:
-            self *= self
-            self **= p // 2
-            return self
         else:
-            tmp = self.copy()
-            for _ in range(p - 2):
-                tmp *= self
-            self *= tmp
+            # Exponentiation by squaring. The factors for the odd bits
+            # of `p` are collected in `result`, the highest bit is `self`.
+            result = None
+            while p > 1:
+                if p % 2 == 1:
+                    if result is None:
+                        result = self.copy()
+                    else:
+                        result *= self
+                self *= self
+                p //= 2
+            if result is not None:
+                self *= result
             return self
 
     def __pow__(self, p):
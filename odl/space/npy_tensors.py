@@ -1373,13 +1373,73 @@ class NumpyTensor(Tensor):
             self.data.conj(out.data)
             return out
 
+    def _is_field_scalar(self, other):
+        """Return ``True`` if ``other`` can be applied as scalar by ufuncs.
+
+        This is the case for scalars from the field of a floating point
+        space. Integer data keeps the generic arithmetic and its casting.
+        """
+        return ((self.space.is_real or self.space.is_complex) and
+                other in self.space.field)
+
+    def __iadd__(self, other):
+        """Return ``self += other``."""
+        if self._is_field_scalar(other):
+            # Add scalars directly instead of via `other * space.one()`
+            np.add(self.data, other, out=self.data)
+            return self
+        return super(NumpyTensor, self).__iadd__(other)
+
+    def __add__(self, other):
+        """Return ``self + other``."""
+        if self._is_field_scalar(other):
+            out = self.space.element()
+            np.add(self.data, other, out=out.data)
+            return out
+        return super(NumpyTensor, self).__add__(other)
+
+    def __isub__(self, other):
+        """Return ``self -= other``."""
+        if self._is_field_scalar(other):
+            np.subtract(self.data, other, out=self.data)
+            return self
+        return super(NumpyTensor, self).__isub__(other)
+
+    def __sub__(self, other):
+        """Return ``self - other``."""
+        if self._is_field_scalar(other):
+            out = self.space.element()
+            np.subtract(self.data, other, out=out.data)
+            return out
+        return super(NumpyTensor, self).__sub__(other)
+
+    def __rsub__(self, other):
+        """Return ``other - self``."""
+        if self._is_field_scalar(other):
+            out = self.space.element()
+            np.subtract(other, self.data, out=out.data)
+            return out
+        return super(NumpyTensor, self).__rsub__(other)
+
+    def __neg__(self):
+        """Return ``-self``."""
+        if self.space.field is None:
+            return NotImplemented
+        out = self.space.element()
+        np.negative(self.data, out=out.data)
+        return out
+
     def __ipow__(self, other):
         """Return ``self **= other``."""
-        try:
-            if other == int(other):
-                return super(NumpyTensor, self).__ipow__(other)
-        except TypeError:
-            pass
+        # Integer powers of floating point data are also computed by the
+        # ufunc, which is a single pass without Python-level recursion.
+        # Integer data keeps the generic method.
+        if not (self.space.is_real or self.space.is_complex):
+            try:
+                if other == int(other):
+                    return super(NumpyTensor, self).__ipow__(other)
+            except (TypeError, ValueError, OverflowError):
+                pass
 
         np.power(self.data, other, out=self.data)
         return self
@@ -1863,27 +1923,31 @@ def _lincomb_impl(a, x1, b, x2, out):
     else:
         # We have exhausted all alignment options, so x1 is not x2 is not out
         # We now optimize for various values of a and b
+        # A scaled copy is done in one pass with `np.multiply` instead of
+        # a copy followed by a scaling.
         if b == 0:
             if a == 0:  # Zero assignment -> out = 0
                 out_arr[:] = 0
-            else:  # Scaled copy -> out = a*x1
+            elif a == 1:  # Copy -> out = x1
                 copy(x1_arr, out_arr, size)
-                if a != 1:
-                    scal(a, out_arr, size)
+            else:  # Scaled copy -> out = a*x1
+                np.multiply(x1_arr, a, out=out_arr)
 
         else:  # b != 0
             if a == 0:  # Scaled copy -> out = b*x2
-                copy(x2_arr, out_arr, size)
-                if b != 1:
-                    scal(b, out_arr, size)
+                if b == 1:
+                    copy(x2_arr, out_arr, size)
+                else:
+                    np.multiply(x2_arr, b, out=out_arr)
 
             elif a == 1:  # No scaling in x1 -> out = x1 + b*x2
                 copy(x1_arr, out_arr, size)
                 axpy(x2_arr, out_arr, size, b)
             else:  # Generic case -> out = a*x1 + b*x2
-                copy(x2_arr, out_arr, size)
-                if b != 1:
-                    scal(b, out_arr, size)
+                if b == 1:
+                    copy(x2_arr, out_arr, size)
+                else:
+                    np.multiply(x2_arr, b, out=out_arr)
                 axpy(x1_arr, out_arr, size, a)
 
 
@@ -718,6 +718,20 @@ def test_astype():
     assert not as_complex.is_weighted
 
 
+def test_pickle(odl_tspace_impl):
+    """Test pickling and unpickling with all protocols."""
+    import pickle
+    impl = odl_tspace_impl
+    discr = odl.uniform_discr([0, 0], [1, 1], [2, 3], impl=impl)
+    x = noise_elements(discr)[1]
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        y = pickle.loads(pickle.dumps(x, protocol))
+        assert y in discr
+        assert y == x
+        assert y is not x
+
+
 def test_ufuncs(odl_tspace_impl, odl_ufunc):
     """Test ufuncs in ``x.ufuncs`` against direct Numpy ufuncs."""
     impl = odl_tspace_impl
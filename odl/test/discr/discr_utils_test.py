@@ -800,6 +800,27 @@ def test_linear_interpolation_2d():
     assert all_equal(out, true_mg)
 
 
+def test_linear_interpolation_broadcast_meshgrid():
+    """Test linear interpolation with broadcastable, non-sparse input."""
+    coord_vecs = [[0.1, 0.3, 0.5, 0.7, 0.9], [0.25, 0.75], [0.0, 1.0, 2.0]]
+    f = np.arange(30, dtype='float64').reshape([5, 2, 3])
+    interpolator = linear_interpolator(f, coord_vecs)
+
+    # The last component depends on two axes, as for a change of coordinates
+    x, y, z = sparse_meshgrid([0.2, 0.4, 0.8], [0.3, 0.5, 0.6, 0.7],
+                              [0.5, 1.0, 1.5, 1.7, 1.9])
+    z = z * (1 + y)
+    pts = np.array([xi.ravel() for xi in np.broadcast_arrays(x, y, z)])
+    true_mg = interpolator(pts).reshape([3, 4, 5])
+    assert all_almost_equal(interpolator((x, y, z)), true_mg)
+
+    # Evaluate in parts, with output array
+    out = np.empty((3, 4, 5), dtype='float64')
+    interpolator((x[:1], y, z), out=out[:1])
+    interpolator((x[1:], y, z), out=out[1:])
+    assert all_almost_equal(out, true_mg)
+
+
 def test_per_axis_interpolation():
     """Test different interpolation schemes per axis."""
     coord_vecs = [[0.125, 0.375, 0.625, 0.875], [0.25, 0.75]]
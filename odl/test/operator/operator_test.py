@@ -220,6 +220,10 @@ def test_operator_vector_mult(dom_eq_ran):
     check_call(rmult_op, x, mult_sq_np(mat, right * xarr))
     check_call(lmult_op, x, left * mult_sq_np(mat, xarr))
 
+    # With a given temporary
+    rmult_op = OperatorRightVectorMult(op, right, tmp=op.domain.element())
+    check_call(rmult_op, x, mult_sq_np(mat, right * xarr))
+
     # Using operator overloading
     check_call(op * right, x, mult_sq_np(mat, right * xarr))
     check_call(left * op, x, left * mult_sq_np(mat, xarr))
@@ -509,6 +513,11 @@ def test_operator_pointwise_product():
     expected = op1(x) * op2(x)
     check_call(prod_op, x, expected)
 
+    # Evaluate with a given temporary
+    prod_op = odl.OperatorPointwiseProduct(op1, op2,
+                                           tmp_ran=op1.range.element())
+    check_call(prod_op, x, expected)
+
     # Derivative
     y = noise_element(op1.domain)
     expected = (op1.derivative(x)(y) * op2(x) +
@@ -526,6 +535,15 @@ def test_operator_pointwise_product():
     check_call(prod_deriv_adj_op, z, expected)
 
 
+def test_power_operator():
+    """Check call of the power operator on float and integer spaces."""
+    for dtype in ['float64', 'complex128', 'int32']:
+        space = odl.tensor_space(3, dtype=dtype)
+        x = space.element([1, 2, 3])
+        op = odl.PowerOperator(space, 2)
+        check_call(op, x, space.element([1, 4, 9]))
+
+
 # FUNCTIONAL TEST
 class SumFunctional(Operator):
 
@@ -903,6 +903,21 @@ def test_python_copy(odl_tspace_impl):
     assert x != z
 
 
+def test_pickle(odl_tspace_impl):
+    """Test pickling and unpickling with all protocols."""
+    import pickle
+    impl = odl_tspace_impl
+    space = odl.tensor_space((3, 4), dtype='float32', exponent=1, weighting=2,
+                             impl=impl)
+    x = noise_element(space)
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        y = pickle.loads(pickle.dumps(x, protocol))
+        assert y in space
+        assert y == x
+        assert y is not x
+
+
 def test_conversion_to_scalar(odl_tspace_impl):
     """Test conversion of size-1 vectors/tensors to scalars."""
     impl = odl_tspace_impl
@@ -15,7 +15,7 @@ from odl.discr.grid import sparse_meshgrid
 from odl.util import is_int_dtype
 from odl.util.testutils import all_equal
 from odl.util.vectorization import (
-    is_valid_input_array, is_valid_input_meshgrid,
+    NUMBA_AVAILABLE, is_valid_input_array, is_valid_input_meshgrid,
     out_shape_from_meshgrid, out_shape_from_array,
     vectorize)
 
@@ -173,14 +173,44 @@ def test_vectorize_1d_otype():
 
     # In-place
     out = np.empty(5, dtype='int')
-    simple_func(arr, out=out)
+    result = simple_func(arr, out=out)
+    assert result is out
     assert all_equal(out, true_result_arr)
 
     out = np.empty(5, dtype='int')
-    simple_func(mg, out=out)
+    result = simple_func(mg, out=out)
+    assert result is out
     assert all_equal(out, true_result_mg)
 
 
+def test_vectorize_1d_otype_kwargs():
+
+    # Test vectorization in 1d with given data type and keyword arguments,
+    # which need to be broadcast against the input
+    arr = np.array([1.0, 2.0, 3.0])
+
+    @vectorize(otypes=['float64'])
+    def simple_func(x, c=0):
+        return x[0] + c
+
+    # Out-of-place
+    assert all_equal(simple_func(arr), [1.0, 2.0, 3.0])
+    assert all_equal(simple_func(arr, c=1.0), [2.0, 3.0, 4.0])
+    assert all_equal(simple_func(arr, c=np.array([10.0, 20.0, 30.0])),
+                     [11.0, 22.0, 33.0])
+
+    # In-place
+    out = np.empty(3)
+    result = simple_func(arr, out=out)
+    assert result is out
+    assert all_equal(out, [1.0, 2.0, 3.0])
+
+    out = np.empty(3)
+    result = simple_func(arr, out=out, c=np.array([10.0, 20.0, 30.0]))
+    assert result is out
+    assert all_equal(out, [11.0, 22.0, 33.0])
+
+
 def test_vectorize_1d_lazy():
 
     # Test vectorization in 1d without data type --> lazy vectorization
@@ -253,11 +283,13 @@ def test_vectorize_2d_dtype():
 
     # In-place
     out = np.empty(5, dtype='int')
-    simple_func(arr, out=out)
+    result = simple_func(arr, out=out)
+    assert result is out
     assert all_equal(out, true_result_arr)
 
     out = np.empty((5, 5), dtype='int')
-    simple_func(mg, out=out)
+    result = simple_func(mg, out=out)
+    assert result is out
     assert all_equal(out, true_result_mg)
 
 
@@ -335,5 +367,59 @@ def test_vectorize_callable_class():
     assert vectorized_call(val_2) == 1
 
 
+def test_vectorize_lazy_num_calls():
+
+    # Lazy vectorization should evaluate each point only once
+    mg = sparse_meshgrid([-3, -2, -1, 0, 1], [-1, 0, 1, 2, 3])
+    calls = []
+
+    @vectorize
+    def simple_func(x):
+        calls.append(x)
+        return 0 if x[0] < 0 and x[1] > 0 else 1
+
+    simple_func(mg)
+    assert len(calls) == 25
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba not available')
+def test_vectorize_jit():
+
+    # Test compiled vectorization against the Numpy variant
+    arr = np.empty((2, 5), dtype='int')
+    arr[0] = ([-3, -2, -1, 0, 1])
+    arr[1] = ([-1, 0, 1, 2, 3])
+    mg = sparse_meshgrid([-3, -2, -1, 0, 1], [-1, 0, 1, 2, 3])
+
+    def simple_func(x):
+        return 0 if x[0] < 0 and x[1] > 0 else 1
+
+    numpy_func = vectorize(otypes=['int'])(simple_func)
+    jit_func = vectorize(otypes=['int'], jit=True)(simple_func)
+
+    # Out-of-place
+    out = jit_func(arr)
+    assert out.dtype == np.dtype('int')
+    assert all_equal(out, numpy_func(arr))
+
+    out = jit_func(mg)
+    assert out.shape == (5, 5)
+    assert all_equal(out, numpy_func(mg))
+
+    assert jit_func((-1, 1)) == 0
+    assert jit_func((2, 1)) == 1
+
+    # In-place
+    out = np.empty((5, 5), dtype='int')
+    jit_func(mg, out=out)
+    assert all_equal(out, numpy_func(mg))
+
+    # Multithreaded
+    parallel_func = vectorize(otypes=['int'], jit=True,
+                              parallel=True)(simple_func)
+    assert all_equal(parallel_func(arr), numpy_func(arr))
+    assert all_equal(parallel_func(mg), numpy_func(mg))
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
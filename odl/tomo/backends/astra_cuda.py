@@ -25,6 +25,7 @@ from odl.tomo.backends.util import _add_default_complex_impl
 from odl.tomo.geometry import (
     ConeBeamGeometry, FanBeamGeometry, Geometry, Parallel2dGeometry,
     Parallel3dAxisGeometry)
+from odl.util import writable_array
 
 try:
     import astra
@@ -108,6 +109,22 @@ class AstraCudaImpl:
 
         self.create_ids()
 
+        # The scalings only depend on the spaces, the geometry and the
+        # ASTRA version, so we compute them once instead of on every call
+        if (
+            isinstance(self.geometry, Parallel2dGeometry)
+            and parse_version(ASTRA_VERSION) < parse_version('1.9.9.dev')
+        ):
+            # parallel2d scales with pixel stride
+            self._fp_scaling_factor = (
+                1 / float(self.geometry.det_partition.cell_volume)
+            )
+        else:
+            self._fp_scaling_factor = None
+        self._bp_scaling_factor = astra_cuda_bp_scaling_factor(
+            self.proj_space, self.vol_space, self.geometry
+        )
+
         # ASTRA projectors are not thread-safe, thus we need to lock manually
         self._mutex = Lock()
 
@@ -218,13 +235,12 @@ class AstraCudaImpl:
             else:
                 out = self.proj_space.element()
 
-            # Copy data to GPU memory
-            if self.geometry.ndim == 2:
-                astra.data2d.store(self.vol_id, vol_data.asarray())
-            elif self.geometry.ndim == 3:
-                astra.data3d.store(self.vol_id, vol_data.asarray())
-            else:
+            # Copy data to GPU memory. Since `vol_id` is linked to
+            # `vol_array`, we can write to it directly instead of going
+            # through `data2d.store` or `data3d.store`.
+            if self.geometry.ndim not in (2, 3):
                 raise RuntimeError('unknown ndim')
+            self.vol_array[:] = vol_data.asarray()
 
             # Run algorithm
             astra.algorithm.run(self.algo_forward_id)
@@ -233,16 +249,18 @@ class AstraCudaImpl:
             if self.geometry.ndim == 2:
                 out[:] = self.proj_array
             elif self.geometry.ndim == 3:
-                out[:] = np.swapaxes(self.proj_array, 0, 1).reshape(
-                    self.proj_space.shape)
+                # Write the swapped array into a reshaped view of `out`
+                # to avoid the temporary copy made by reshaping the
+                # non-contiguous swapped array. Requesting C order makes
+                # sure that the reshape below is a view.
+                swapped_proj_array = np.swapaxes(self.proj_array, 0, 1)
+                with writable_array(out, order='C') as out_arr:
+                    out_arr.reshape(swapped_proj_array.shape)[:] = (
+                        swapped_proj_array)
 
             # Fix scaling to weight by pixel size
-            if (
-                isinstance(self.geometry, Parallel2dGeometry)
-                and parse_version(ASTRA_VERSION) < parse_version('1.9.9.dev')
-            ):
-                # parallel2d scales with pixel stride
-                out *= 1 / float(self.geometry.det_partition.cell_volume)
+            if self._fp_scaling_factor is not None:
+                out *= self._fp_scaling_factor
 
             return out
 
@@ -277,27 +295,25 @@ class AstraCudaImpl:
             else:
                 out = self.vol_space.element()
 
-            # Copy data to GPU memory
+            # Copy data to GPU memory. Since `sino_id` is linked to
+            # `proj_array`, we write to it directly.
             if self.geometry.ndim == 2:
-                astra.data2d.store(self.sino_id, proj_data.asarray())
+                self.proj_array[:] = proj_data.asarray()
             elif self.geometry.ndim == 3:
+                # Write the swapped data without making a contiguous copy
+                # first
                 shape = (-1,) + self.geometry.det_partition.shape
                 reshaped_proj_data = proj_data.asarray().reshape(shape)
-                swapped_proj_data = np.ascontiguousarray(
-                    np.swapaxes(reshaped_proj_data, 0, 1)
-                )
-                astra.data3d.store(self.sino_id, swapped_proj_data)
+                self.proj_array[:] = np.swapaxes(reshaped_proj_data, 0, 1)
 
             # Run algorithm
             astra.algorithm.run(self.algo_backward_id)
 
-            # Copy result to CPU memory
-            out[:] = self.vol_array
-
-            # Fix scaling to weight by pixel/voxel size
-            out *= astra_cuda_bp_scaling_factor(
-                self.proj_space, self.vol_space, self.geometry
-            )
+            # Copy result to CPU memory and fix scaling to weight by
+            # pixel/voxel size in a single pass
+            with writable_array(out) as out_arr:
+                np.multiply(self.vol_array, self._bp_scaling_factor,
+                            out=out_arr)
 
             return out
 
@@ -14,7 +14,7 @@ import numpy as np
 
 from odl.discr import DiscretizedSpace, uniform_discr
 from odl.operator import Operator
-from odl.set import ComplexNumbers, RealNumbers
+from odl.set import ComplexNumbers
 from odl.trafos.backends.pyfftw_bindings import (
     PYFFTW_AVAILABLE, _flag_pyfftw_to_odl, pyfftw_call)
 from odl.trafos.util import (
@@ -1265,9 +1265,9 @@ class FourierTransform(FourierTransformBase):
         a temporary or a new array.
         """
         if out is None:
-            if self.domain.field == ComplexNumbers():
+            if self.domain.is_complex:
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
-            elif self.domain.field == RealNumbers() and not self.halfcomplex:
+            elif self.domain.is_real and not self.halfcomplex:
                 out = self._tmp_f
             else:
                 out = self._tmp_r
@@ -1286,7 +1286,7 @@ class FourierTransform(FourierTransformBase):
         a temporary or a new array.
         """
         if out is None:
-            if self.domain.field == ComplexNumbers():
+            if self.domain.is_complex:
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
             else:
                 out = self._tmp_f
@@ -1507,7 +1507,7 @@ class FourierTransformInverse(FourierTransformBase):
         a temporary or a new array.
         """
         if out is None:
-            if self.range.field == ComplexNumbers():
+            if self.range.is_complex:
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
             else:
                 out = self._tmp_f
@@ -1529,9 +1529,9 @@ class FourierTransformInverse(FourierTransformBase):
         a temporary or a new array.
         """
         if out is None:
-            if self.range.field == ComplexNumbers():
+            if self.range.is_complex:
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
-            elif self.range.field == RealNumbers() and not self.halfcomplex:
+            elif self.range.is_real and not self.halfcomplex:
                 out = self._tmp_f
             else:  # halfcomplex
                 out = self._tmp_r
@@ -1573,7 +1573,7 @@ class FourierTransformInverse(FourierTransformBase):
         if self.halfcomplex:
             assert is_real_dtype(out.dtype)
 
-        if self.range.field == RealNumbers():
+        if self.range.is_real:
             return out.real
         else:
             return out
@@ -1612,7 +1612,7 @@ class FourierTransformInverse(FourierTransformBase):
 
         # Pre-processing in IFT = post-processing in FT, but with division
         # instead of multiplication and switched grids. In-place for C2C only.
-        if self.range.field == ComplexNumbers():
+        if self.range.is_complex:
             # preproc is out in this case
             preproc = self._preprocess(x, out=out)
         else:
@@ -1620,7 +1620,7 @@ class FourierTransformInverse(FourierTransformBase):
 
         # The actual call to the FFT library. We store the plan for re-use.
         direction = 'forward' if self.sign == '-' else 'backward'
-        if self.range.field == RealNumbers() and not self.halfcomplex:
+        if self.range.is_real and not self.halfcomplex:
             # Need to use a complex array as out if we do C2R since the
             # FFT has to be C2C
             self._fftw_plan = pyfftw_call(
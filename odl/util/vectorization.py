@@ -13,6 +13,13 @@ from builtins import object
 from functools import wraps
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
 
 __all__ = ('is_valid_input_array', 'is_valid_input_meshgrid',
            'out_shape_from_meshgrid', 'out_shape_from_array',
@@ -40,15 +47,18 @@ def is_valid_input_meshgrid(x, ndim):
     if not isinstance(x, tuple):
         return False
 
+    if not (len(x) == ndim and
+            all(isinstance(xi, np.ndarray) for xi in x) and
+            all(xi.ndim == ndim for xi in x)):
+        return False
+
     if ndim > 1:
         try:
             np.broadcast(*x)
-        except (ValueError, TypeError):  # cannot be broadcast
+        except ValueError:  # cannot be broadcast
             return False
 
-    return (len(x) == ndim and
-            all(isinstance(xi, np.ndarray) for xi in x) and
-            all(xi.ndim == ndim for xi in x))
+    return True
 
 
 def out_shape_from_meshgrid(mesh):
@@ -215,6 +225,12 @@ class vectorize(OptionalArgDecorator):
     ...     return x[0] + x[1] if x[0] < x[1] else x[0] - x[1]
     >>> f([[0, -2], [1, 4]])
     array([ 1.,  2.], dtype=float32)
+
+    With ``jit=True``, the function is compiled with Numba instead, which
+    requires it to be compilable in ``nopython`` mode. It is then called
+    with a 1d ``float64`` array of point coordinates and cannot take
+    ``kwargs``. Additionally passing ``parallel=True`` distributes the
+    points over multiple threads.
     """
 
     @staticmethod
@@ -224,8 +240,12 @@ class vectorize(OptionalArgDecorator):
             # Set name if not available. Happens if func is actually a function
             func.__name__ = '{}.__call__'.format(func.__class__.__name__)
 
-        return wraps(func)(_NumpyVectorizeWrapper(func, *vect_args,
-                                                  **vect_kwargs))
+        if vect_kwargs.pop('jit', False):
+            return wraps(func)(_NumbaVectorizeWrapper(func, *vect_args,
+                                                      **vect_kwargs))
+        else:
+            return wraps(func)(_NumpyVectorizeWrapper(func, *vect_args,
+                                                      **vect_kwargs))
 
 
 class _NumpyVectorizeWrapper(object):
@@ -254,6 +274,14 @@ class _NumpyVectorizeWrapper(object):
         self.vect_args = vect_args
         self.vect_kwargs = vect_kwargs
 
+        # With a known output type and no other options, single-component
+        # input can be evaluated point by point with `numpy.fromiter`
+        if (not vect_args and vect_kwargs.get('otypes') and
+                set(vect_kwargs) <= {'otypes', 'cache', 'doc'}):
+            self.iter_dtype = np.dtype(vect_kwargs['otypes'][0])
+        else:
+            self.iter_dtype = None
+
     def __call__(self, x, out=None, **kwargs):
         """Vectorized function call.
 
@@ -275,18 +303,124 @@ class _NumpyVectorizeWrapper(object):
         elif isinstance(x, np.ndarray) and x.ndim == 1:
             x = x[None, :]
 
+        if self.iter_dtype is not None and len(x) == 1 and not kwargs:
+            # Fill the result directly instead of going through the
+            # intermediate object array of `numpy.vectorize`. Keyword
+            # arguments are broadcast by `numpy.vectorize`, hence they
+            # are left to that path.
+            x0 = np.asarray(x[0])
+            values = np.fromiter(
+                (self.func(np.array([xi])) for xi in x0.flat),
+                dtype=self.iter_dtype, count=x0.size).reshape(x0.shape)
+            if out is None:
+                return values
+            else:
+                out[:] = values
+                return out
+
         if self.vfunc is None:
             # Not yet vectorized
             def _func(*x, **kw):
                 return self.func(np.array(x), **kw)
 
-            self.vfunc = np.vectorize(_func, *self.vect_args,
-                                      **self.vect_kwargs)
+            # Without `otypes`, `numpy.vectorize` determines the output
+            # type by evaluating the first point. With `cache=True`, that
+            # result is reused instead of evaluating the point twice.
+            vect_kwargs = dict(self.vect_kwargs)
+            vect_kwargs.setdefault('cache', True)
+            self.vfunc = np.vectorize(_func, *self.vect_args, **vect_kwargs)
 
         if out is None:
             return self.vfunc(*x, **kwargs)
         else:
             out[:] = self.vfunc(*x, **kwargs)
+            return out
+
+
+class _NumbaVectorizeWrapper(object):
+
+    """Class for vectorization wrapping using Numba.
+
+    The purpose of this class is to compile the function to a generalized
+    ufunc when it is called for the first time. The ufunc evaluates all
+    points in machine code.
+    """
+
+    def __init__(self, func, otypes=None, parallel=False):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        func : callable
+            Python function to be wrapped. It must be compilable by Numba
+            in ``nopython`` mode and take the point coordinates as a 1d
+            array.
+        otypes : sequence of dtypes, optional
+            Output data type as for `numpy.vectorize`. Only the first
+            entry is used. Default: ``'float64'``
+        parallel : bool, optional
+            If ``True``, distribute the points over multiple threads.
+            This pays off only for large inputs or expensive functions.
+        """
+        super(_NumbaVectorizeWrapper, self).__init__()
+        if not NUMBA_AVAILABLE:
+            raise ValueError('`numba` package is not available; you need '
+                             'to install it to use `jit=True`')
+
+        self.func = func
+        self.gufunc = None
+        self.out_dtype = np.dtype('float64' if otypes is None else otypes[0])
+        self.target = 'parallel' if parallel else 'cpu'
+
+    def __call__(self, x, out=None):
+        """Vectorized function call.
+
+        Parameters
+        ----------
+        x : `array-like` or sequence of `array-like`'s
+            Input argument(s) to the wrapped function
+        out : `numpy.ndarray`, optional
+            Appropriately sized array to write to
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the vectorized function evaluation. If ``out``
+            was given, the returned object is a reference to it.
+        """
+        if np.isscalar(x):
+            x = np.array([x])
+        elif isinstance(x, np.ndarray) and x.ndim == 1:
+            x = x[None, :]
+
+        # Arrange the points along the last axis, as the ufunc expects.
+        # A meshgrid is written into the point array one component at a
+        # time, which broadcasts and casts in a single pass.
+        if isinstance(x, tuple):
+            points = np.empty(np.broadcast(*x).shape + (len(x),),
+                              dtype='float64')
+            for i, xi in enumerate(x):
+                points[..., i] = xi
+        else:
+            points = np.moveaxis(np.asarray(x), 0, -1)
+            points = points.astype('float64', copy=False)
+
+        if self.gufunc is None:
+            # Not yet compiled
+            jit_func = numba.njit(self.func)
+
+            def kernel(x, out):
+                out[0] = jit_func(x)
+
+            out_type = numba.from_dtype(self.out_dtype)
+            self.gufunc = numba.guvectorize(
+                [(numba.float64[:], out_type[:])], '(d)->()', nopython=True,
+                target=self.target)(kernel)
+
+        if out is None:
+            return self.gufunc(points)
+        else:
+            return self.gufunc(points, out)
 
 
 if __name__ == '__main__':